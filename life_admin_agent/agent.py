@@ -23,6 +23,7 @@ import logging
 from .google_tools import (
     # Calendar
     create_calendar_event,
+    create_calendar_events_bulk,
     list_calendar_events,
     # Gmail
     create_gmail_draft,
@@ -31,6 +32,7 @@ from .google_tools import (
     list_task_lists,
     list_tasks,
     create_task,
+    create_tasks_bulk,
     complete_task,
     # Photos
     search_google_photos,
@@ -39,6 +41,7 @@ from .google_tools import (
     # Utility
     get_current_datetime,
 )
+from .batch import as_async_tool, execute_actions_in_parallel
 
 # Configure logging for observability
 logging.basicConfig(level=logging.INFO)
@@ -48,11 +51,7 @@ logger = logging.getLogger("LifeAdminAgent")
 # SUB-AGENT: Calendar & Email Agent
 # =============================================================================
 
-calendar_email_agent = Agent(
-    name="calendar_email_agent",
-    model="gemini-2.0-flash",
-    description="Manages Google Calendar events and Gmail emails/drafts.",
-    instruction="""You are a Calendar and Email Assistant that helps manage schedules and communications.
+_CALENDAR_EMAIL_INSTRUCTION = """You are a Calendar and Email Assistant that helps manage schedules and communications.
 
 IMPORTANT: Always call get_current_datetime FIRST to know today's date before creating any calendar event.
 
@@ -73,19 +72,28 @@ GUIDELINES:
 - Example: For 3 PM on December 1, 2025, use: "2025-12-01T15:00:00"
 - "today at 3pm" means you need to get today's date and format as "2025-12-01T15:00:00"
 - Default duration is 1 hour if not specified
+- When the user wants several events at once, create them all with ONE create_calendar_events_bulk call instead of calling create_calendar_event repeatedly
 - For emails, always create a draft first unless user explicitly says to send
+- When a request needs several independent actions (e.g. an event AND a draft), issue all the tool calls together in one turn instead of one at a time
 - Be professional but friendly in email drafts
 - DO NOT ask for confirmation - just create the events directly
 
 EXAMPLES:
 - "Schedule a meeting today at 3pm" → get_current_datetime, then create_calendar_event with start_time="2025-12-01T15:00:00"
 - "Draft an email to john@example.com about the project" → create_gmail_draft
-- "What's on my calendar this week?" → list_calendar_events""",
+- "What's on my calendar this week?" → list_calendar_events"""
+
+calendar_email_agent = Agent(
+    name="calendar_email_agent",
+    model="gemini-2.0-flash",
+    description="Manages Google Calendar events and Gmail emails/drafts.",
+    instruction=_CALENDAR_EMAIL_INSTRUCTION,
     tools=[
-        create_calendar_event,
-        list_calendar_events,
-        create_gmail_draft,
-        send_email,
+        as_async_tool(create_calendar_event),
+        as_async_tool(create_calendar_events_bulk),
+        as_async_tool(list_calendar_events),
+        as_async_tool(create_gmail_draft),
+        as_async_tool(send_email),
         get_current_datetime,
     ]
 )
@@ -94,11 +102,7 @@ EXAMPLES:
 # SUB-AGENT: Tasks Agent
 # =============================================================================
 
-tasks_agent = Agent(
-    name="tasks_agent",
-    model="gemini-2.0-flash",
-    description="Manages Google Tasks - create, list, and complete tasks.",
-    instruction="""You are a Task Management Assistant that helps organize and track tasks using Google Tasks.
+_TASKS_INSTRUCTION = """You are a Task Management Assistant that helps organize and track tasks using Google Tasks.
 
 IMPORTANT: Always call get_current_datetime FIRST to know today's date before creating any task.
 
@@ -124,18 +128,27 @@ GUIDELINES:
 - If user mentions a time (like "3pm"), include it in the notes since Google Tasks only supports dates
 - Use "@default" for the main task list unless user specifies otherwise
 - When creating tasks, include helpful notes with time info if the user provides context
+- When the user asks for several tasks at once, create them all with ONE create_tasks_bulk call instead of calling create_task repeatedly
 - Celebrate when tasks are completed! 🎉
 - DO NOT ask for confirmation - just create the tasks directly
 
 EXAMPLES:
 - "Remind me to go to dentist today at 3pm" → get_current_datetime, then create_task with due_date="2025-12-01" and notes="Appointment at 3:00 PM"
+- "Add reminders to renew my license, passport and insurance" → create_tasks_bulk with all three tasks
 - "What are my tasks?" → list_tasks
-- "I finished the report" → complete_task""",
+- "I finished the report" → complete_task"""
+
+tasks_agent = Agent(
+    name="tasks_agent",
+    model="gemini-2.0-flash",
+    description="Manages Google Tasks - create, list, and complete tasks.",
+    instruction=_TASKS_INSTRUCTION,
     tools=[
-        list_task_lists,
-        list_tasks,
-        create_task,
-        complete_task,
+        as_async_tool(list_task_lists),
+        as_async_tool(list_tasks),
+        as_async_tool(create_task),
+        as_async_tool(create_tasks_bulk),
+        as_async_tool(complete_task),
         get_current_datetime,
     ]
 )
@@ -144,11 +157,7 @@ EXAMPLES:
 # SUB-AGENT: Photos Agent
 # =============================================================================
 
-photos_agent = Agent(
-    name="photos_agent",
-    model="gemini-2.0-flash",
-    description="Searches Google Photos for documents, receipts, and other images.",
-    instruction="""You are a Photos Assistant that helps find and organize photos in Google Photos.
+_PHOTOS_INSTRUCTION = """You are a Photos Assistant that helps find and organize photos in Google Photos.
 
 YOUR CAPABILITIES:
 1. **Search Photos**:
@@ -170,11 +179,17 @@ GUIDELINES:
 EXAMPLES:
 - "Find my driver's license photo" → search_google_photos with query
 - "Show my photo albums" → list_photo_albums
-- "What documents do I have saved?" → search_google_photos for documents""",
+- "What documents do I have saved?" → search_google_photos for documents"""
+
+photos_agent = Agent(
+    name="photos_agent",
+    model="gemini-2.0-flash",
+    description="Searches Google Photos for documents, receipts, and other images.",
+    instruction=_PHOTOS_INSTRUCTION,
     tools=[
-        search_google_photos,
-        list_photo_albums,
-        get_photos_from_album,
+        as_async_tool(search_google_photos),
+        as_async_tool(list_photo_albums),
+        as_async_tool(get_photos_from_album),
     ]
 )
 
@@ -182,11 +197,7 @@ EXAMPLES:
 # ROOT AGENT: Life Admin Concierge
 # =============================================================================
 
-root_agent = Agent(
-    name="life_admin_concierge",
-    model="gemini-2.0-flash",
-    description="Personal Life Admin Concierge - manages calendar, email, tasks, and photos.",
-    instruction="""You are a Personal Life Admin Concierge, an AI assistant that helps manage your digital life.
+_ROOT_INSTRUCTION = """You are a Personal Life Admin Concierge, an AI assistant that helps manage your digital life.
 
 YOUR ROLE:
 You coordinate between specialized sub-agents to help with:
@@ -212,7 +223,9 @@ ROUTING GUIDELINES:
 - Task lists, to-dos, reminders → delegate to tasks_agent
 - Finding photos, documents, albums → delegate to photos_agent
 - General questions → handle yourself
-- When user asks to do MULTIPLE things (e.g., "add to calendar AND create a reminder"), delegate to BOTH relevant agents
+- When user asks for MULTIPLE independent actions of DIFFERENT kinds (e.g., "add to calendar AND create a reminder AND draft an email"), call get_current_datetime, then do them all at once with execute_actions_in_parallel instead of delegating to each agent in turn
+- When every action is the same kind (e.g., "add reminders for license, passport and insurance", or several events), delegate to the owning agent, which creates them in one batched request
+- Use delegation for anything execute_actions_in_parallel does not cover (listing, completing tasks, sending email, photos)
 
 PERSONALITY:
 - Be helpful and proactive - DO NOT ask for unnecessary confirmations
@@ -220,7 +233,17 @@ PERSONALITY:
 - Provide clear summaries of what was done
 - Suggest related actions (e.g., after creating a task, offer to add it to calendar)
 
-When starting a conversation, briefly introduce what you can help with.""",
+When starting a conversation, briefly introduce what you can help with."""
+
+root_agent = Agent(
+    name="life_admin_concierge",
+    model="gemini-2.0-flash",
+    description="Personal Life Admin Concierge - manages calendar, email, tasks, and photos.",
+    instruction=_ROOT_INSTRUCTION,
+    tools=[
+        execute_actions_in_parallel,
+        get_current_datetime,
+    ],
     sub_agents=[calendar_email_agent, tasks_agent, photos_agent]
 )
 
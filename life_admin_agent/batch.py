@@ -0,0 +1,160 @@
+"""
+Batch Tool Dispatch - Run independent Google API tool calls concurrently
+
+The tools in google_tools.py are synchronous and spend almost all of their
+time waiting on Google's servers. When one request fans out into several
+independent actions (e.g. a calendar event AND a task AND a draft), running
+them back to back costs one network round-trip each. Calls dispatched
+through run_tools_concurrently (the root agent's execute_actions_in_parallel
+tool) or awaited via as_async_tool wrappers overlap instead, so the batch
+takes about as long as its slowest call. Tools called directly stay
+sequential.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+from .google_tools import create_calendar_event, create_gmail_draft, create_task
+
+# Configure logging
+logger = logging.getLogger("LifeAdminAgent.Batch")
+
+# Cap on Google API calls in flight at once, to stay clear of per-user rate
+# limits when many tool calls are dispatched together. The calls get their
+# own thread pool so queued tool calls never tie up the event loop's default
+# executor (which also resolves DNS for the model client).
+MAX_CONCURRENT_API_CALLS = 10
+_API_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_API_CALLS, thread_name_prefix="google-api"
+)
+
+
+async def run_sync(fn: Callable[..., dict], *args, **kwargs) -> dict:
+    """Run a synchronous tool on the API thread pool, at most MAX_CONCURRENT_API_CALLS at once"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_API_EXECUTOR, functools.partial(fn, *args, **kwargs))
+
+
+def as_async_tool(fn: Callable[..., dict]) -> Callable[..., Any]:
+    """
+    Wrap a synchronous Google API tool as an async tool for ADK.
+    
+    The wrapper keeps the tool's name, docstring and signature, so the
+    model sees the same function declaration, but ADK awaits it without
+    blocking the event loop on the HTTP request.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await run_sync(fn, *args, **kwargs)
+    
+    return wrapper
+
+
+async def run_tools_concurrently(
+    tool_calls: List[Tuple[Callable[..., dict], Dict[str, Any]]]
+) -> List[dict]:
+    """
+    Run several synchronous tool functions at the same time.
+
+    Each tool runs in a worker thread so the event loop stays free while
+    the Google API requests are in flight.
+
+    Args:
+        tool_calls: List of (tool_function, keyword_arguments) pairs
+
+    Returns:
+        List of tool results, in the same order as tool_calls. If a call
+        raises (e.g. bad arguments), the exception is returned in its slot.
+    """
+    logger.info("[BATCH] run_tools_concurrently: %s calls", len(tool_calls))
+
+    return list(await asyncio.gather(
+        *(run_sync(fn, **kwargs) for fn, kwargs in tool_calls),
+        return_exceptions=True
+    ))
+
+
+# Write actions the root agent may fan out in one call. send_email is left
+# out on purpose: sending still goes through calendar_email_agent.
+_PARALLEL_TOOLS = {
+    "create_calendar_event": create_calendar_event,
+    "create_gmail_draft": create_gmail_draft,
+    "create_task": create_task,
+}
+
+
+async def execute_actions_in_parallel(actions: List[Dict[str, Any]]) -> dict:
+    """
+    Run several independent actions of different kinds (events, drafts,
+    tasks) at the same time. Several actions of one kind (e.g. three tasks)
+    are cheaper as one call to that agent's bulk tool.
+    
+    Args:
+        actions: List of actions, each shaped like {"tool": <name>, "args": {...}}.
+            Supported tools and their args:
+            - create_calendar_event: title, start_time (required, ISO format
+              "YYYY-MM-DDTHH:MM:SS", e.g. "2025-12-01T15:00:00"), and optional
+              duration_hours, description, location, reminder_minutes
+            - create_gmail_draft: to, subject, body (required), and optional cc, bcc
+            - create_task: title (required), and optional notes,
+              due_date ("YYYY-MM-DD"), task_list_id
+            Example: {"tool": "create_task", "args": {"title": "Renew license", "due_date": "2025-12-15"}}
+    
+    Returns:
+        Dictionary with one result per action, in the same order as actions
+    """
+    logger.info("[TOOL] execute_actions_in_parallel: %s actions", len(actions))
+    
+    results: List[Any] = [None] * len(actions)
+    tool_calls = []
+    positions = []
+    
+    for i, action in enumerate(actions):
+        if not isinstance(action, dict):
+            results[i] = {
+                "success": False,
+                "error": f"Invalid action (expected an object): {action!r}",
+            }
+            continue
+        
+        tool_name = action.get("tool")
+        tool = _PARALLEL_TOOLS.get(tool_name) if isinstance(tool_name, str) else None
+        if tool is None:
+            results[i] = {
+                "success": False,
+                "error": f"Unsupported tool: {tool_name!r}",
+                "supported_tools": list(_PARALLEL_TOOLS),
+            }
+            continue
+        
+        args = action.get("args")
+        if args is None:
+            args = {}
+        if not isinstance(args, dict):
+            results[i] = {
+                "success": False,
+                "tool": tool_name,
+                "error": f"Invalid args for {tool_name} (expected an object): {args!r}",
+            }
+            continue
+        
+        tool_calls.append((tool, args))
+        positions.append(i)
+    
+    for i, result in zip(positions, await run_tools_concurrently(tool_calls)):
+        if isinstance(result, Exception):
+            logger.error("[TOOL] Parallel action error: %s", result)
+            result = {"success": False, "error": str(result)}
+        results[i] = result
+    
+    succeeded = sum(1 for r in results if r.get("success"))
+    
+    return {
+        "success": succeeded == len(results),
+        "count": len(results),
+        "results": results,
+        "message": f"⚡ Completed {succeeded}/{len(results)} actions in parallel"
+    }
@@ -6,15 +6,18 @@ Requires: token.json file generated by setup_google_auth.py
 """
 
 import os
+import re
+import copy
+import sys
+import tempfile
+import hashlib
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 import base64
 from email.mime.text import MIMEText
-try:
-    from zoneinfo import ZoneInfo
-except ImportError:
-    from backports.zoneinfo import ZoneInfo
+from email.utils import getaddresses
 import time
 
 # Configure logging
@@ -23,46 +26,314 @@ logger = logging.getLogger("LifeAdminAgent.GoogleTools")
 # Path to token file
 TOKEN_FILE = os.path.join(os.path.dirname(__file__), '..', 'token.json')
 
+# Credentials are shared process-wide; service clients are cached per thread
+# because the httplib2 connection inside each client is not thread-safe.
+_credentials = None
+_credentials_lock = threading.Lock()
+_thread_local = threading.local()
+
+# Discovery documents fetched over the network are kept on disk between runs.
+# Only Photos needs this; the other APIs ship static documents with
+# googleapiclient.
+DISCOVERY_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'life_admin_agent', 'discovery')
+DISCOVERY_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+# Short-lived cache for read-only list calls, so the model re-asking "what's
+# on my calendar" within a turn does not repeat the API request. Write tools
+# invalidate their API's entries. Set LIST_CACHE_TTL_SECONDS=0 to disable.
+LIST_CACHE_TTL_SECONDS = float(os.getenv("LIST_CACHE_TTL_SECONDS", "30"))
+LIST_CACHE_MAX_ENTRIES = 64
+_list_cache: Dict[tuple, tuple] = {}
+_list_cache_generations: Dict[str, int] = {}
+_list_cache_lock = threading.Lock()
+
+# Maximum requests per Google API batch HTTP call (Calendar's limit is 50)
+API_BATCH_SIZE = 50
+
 def _get_credentials():
-    """Load credentials from token.json"""
+    """Load credentials from token.json, reusing them while still valid"""
+    global _credentials
     from google.oauth2.credentials import Credentials
     from google.auth.transport.requests import Request
     
-    if not os.path.exists(TOKEN_FILE):
-        raise FileNotFoundError(
-            f"token.json not found! Please run 'python setup_google_auth.py' first "
-            f"to authenticate with Google APIs. Expected path: {TOKEN_FILE}"
-        )
+    with _credentials_lock:
+        if _credentials is not None and _credentials.valid:
+            return _credentials
+        
+        if not os.path.exists(TOKEN_FILE):
+            raise FileNotFoundError(
+                f"token.json not found! Please run 'python setup_google_auth.py' first "
+                f"to authenticate with Google APIs. Expected path: {TOKEN_FILE}"
+            )
+        
+        creds = Credentials.from_authorized_user_file(TOKEN_FILE)
+        
+        # Refresh if expired
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+            # Save refreshed token
+            with open(TOKEN_FILE, 'w') as token:
+                token.write(creds.to_json())
+        
+        _credentials = creds
+        return creds
+
+
+def _discovery_cache():
+    """Build a file-backed discovery document cache for googleapiclient"""
+    from googleapiclient.discovery_cache.base import Cache
     
-    creds = Credentials.from_authorized_user_file(TOKEN_FILE)
+    class _FileCache(Cache):
+        def _path(self, url):
+            name = hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json'
+            return os.path.join(DISCOVERY_CACHE_DIR, name)
+        
+        def get(self, url):
+            path = self._path(url)
+            try:
+                if time.time() - os.path.getmtime(path) > DISCOVERY_CACHE_MAX_AGE:
+                    return None
+                with open(path, 'r', encoding='utf-8') as f:
+                    return f.read()
+            except OSError:
+                return None
+        
+        def set(self, url, content):
+            path = self._path(url)
+            tmp_path = None
+            try:
+                os.makedirs(DISCOVERY_CACHE_DIR, exist_ok=True)
+                # A unique temp file per writer, so concurrent threads and
+                # processes never write into the same file
+                fd, tmp_path = tempfile.mkstemp(dir=DISCOVERY_CACHE_DIR, suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning("Could not cache discovery document: %s", e)
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
     
-    # Refresh if expired
-    if creds and creds.expired and creds.refresh_token:
-        creds.refresh(Request())
-        # Save refreshed token
-        with open(TOKEN_FILE, 'w') as token:
-            token.write(creds.to_json())
+    return _FileCache()
+
+
+def _list_cache_get(key: tuple) -> Optional[dict]:
+    """
+    Return a copy of a cached list result, or None if missing or expired.
     
-    return creds
+    Callers (and ADK callbacks) may modify the returned dict, so the cached
+    one is never handed out directly.
+    """
+    with _list_cache_lock:
+        entry = _list_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del _list_cache[key]
+            return None
+    return copy.deepcopy(result)
+
+
+def _list_cache_generation(api_name: str) -> int:
+    """Return the API's invalidation count; take it before fetching a listing"""
+    with _list_cache_lock:
+        return _list_cache_generations.get(api_name, 0)
+
+
+def _list_cache_set(key: tuple, result: dict, generation: int):
+    """
+    Cache a successful list result for LIST_CACHE_TTL_SECONDS.
+    
+    The result is dropped if a write invalidated the API after `generation`
+    was taken, since the listing may predate that write.
+    """
+    if LIST_CACHE_TTL_SECONDS <= 0:
+        return
+    with _list_cache_lock:
+        if _list_cache_generations.get(key[0], 0) != generation:
+            return
+        
+        now = time.monotonic()
+        for k in [k for k, (expires_at, _) in _list_cache.items() if now >= expires_at]:
+            del _list_cache[k]
+        
+        # Evict the oldest entries (dicts keep insertion order) to stay bounded
+        _list_cache.pop(key, None)
+        while len(_list_cache) >= LIST_CACHE_MAX_ENTRIES:
+            del _list_cache[next(iter(_list_cache))]
+        
+        # Store a copy, since the caller goes on to return `result` itself
+        _list_cache[key] = (now + LIST_CACHE_TTL_SECONDS, copy.deepcopy(result))
+
+
+def _list_cache_invalidate(api_name: str):
+    """Drop every cached list result for one API (e.g. after a write)"""
+    with _list_cache_lock:
+        _list_cache_generations[api_name] = _list_cache_generations.get(api_name, 0) + 1
+        for key in [k for k in _list_cache if k[0] == api_name]:
+            del _list_cache[key]
+
+
+def _execute_batch(service, requests: list) -> List[tuple]:
+    """
+    Send API requests using batch HTTP calls of up to API_BATCH_SIZE each.
+    
+    If a batch call fails outright, its requests and any later ones get
+    that exception; results from earlier batch calls are kept.
+    
+    Returns:
+        List of (response, exception) pairs, in the same order as requests
+    """
+    outcomes: List[tuple] = [(None, None)] * len(requests)
+    
+    def _collect(request_id, response, exception):
+        outcomes[int(request_id)] = (response, exception)
+    
+    for start in range(0, len(requests), API_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_collect)
+        for i in range(start, min(start + API_BATCH_SIZE, len(requests))):
+            batch.add(requests[i], request_id=str(i))
+        try:
+            batch.execute()
+        except Exception as e:
+            # Keep what earlier chunks created; fail this chunk's unanswered
+            # requests and every request not sent yet
+            logger.error("[TOOL] Batch request error: %s", e)
+            for i in range(start, len(requests)):
+                if outcomes[i] == (None, None):
+                    outcomes[i] = (None, e)
+            break
+    
+    return outcomes
+
+
+# Marks a required field in _bulk_item_fields specs
+_REQUIRED = object()
+
+def _bulk_item_fields(item: Any, fields: Dict[str, tuple]) -> dict:
+    """
+    Read one bulk-tool item, applying defaults and type checks.
+    
+    Args:
+        item: One entry from a bulk tool's list
+        fields: Field name -> (allowed type or types, default); a default
+            of _REQUIRED marks the field as required
+    
+    Returns:
+        Dictionary of field values; a missing or null field gets its default
+    
+    Raises:
+        ValueError: If the item is not an object, a required field is
+            missing, or a field has the wrong type
+    """
+    if not isinstance(item, dict):
+        raise ValueError(f"expected an object, got {item!r}")
+    
+    values = {}
+    for name, (types, default) in fields.items():
+        value = item.get(name)
+        if value is None:
+            if default is _REQUIRED:
+                raise ValueError(f"missing required field '{name}'")
+            value = default
+        # bool is an int subclass, but True is never a valid duration or count
+        elif isinstance(value, bool) or not isinstance(value, types):
+            raise ValueError(f"field '{name}' has the wrong type: {value!r}")
+        values[name] = value
+    
+    return values
 
 
 def _get_service(api_name: str, version: str):
-    """Build a Google API service client"""
+    """
+    Get a Google API service client, building it on first use.
+    
+    Clients are reused for later calls on the same thread so discovery,
+    auth setup and the HTTPS connection are not paid on every tool call.
+    A cached client is rebuilt whenever the credentials had to be reloaded
+    (e.g. token.json was regenerated after a revoked refresh token).
+    """
     from googleapiclient.discovery import build
     
     creds = _get_credentials()
     
+    services = getattr(_thread_local, 'services', None)
+    if services is None:
+        services = _thread_local.services = {}
+    
+    cached = services.get((api_name, version))
+    if cached is not None and cached[1] is creds:
+        return cached[0]
+    
     # Photos API needs static_discovery=False
     if api_name == 'photoslibrary':
-        return build(api_name, version, credentials=creds, static_discovery=False)
+        service = build(
+            api_name, version, credentials=creds,
+            static_discovery=False, cache=_discovery_cache()
+        )
+    else:
+        service = build(api_name, version, credentials=creds)
     
-    return build(api_name, version, credentials=creds)
+    services[(api_name, version)] = (service, creds)
+    return service
 
 
 # =============================================================================
 # GOOGLE CALENDAR API
 # =============================================================================
 
+# datetime.fromisoformat() only understands a trailing 'Z' from Python 3.11
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 date/datetime string, including a 'Z' UTC suffix"""
+    if not _FROMISOFORMAT_ACCEPTS_Z and value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def _event_body(
+    title: str,
+    start_time: str,
+    duration_hours: float = 1.0,
+    description: str = "",
+    location: str = "",
+    reminder_minutes: int = 30
+) -> dict:
+    """Build a Google Calendar insert body"""
+    # Parse start time
+    start_dt = _parse_iso_datetime(start_time)
+    
+    end_dt = start_dt + timedelta(hours=duration_hours)
+    
+    # Get local timezone - use Asia/Kolkata for IST
+    local_tz = 'Asia/Kolkata'
+    
+    return {
+        'summary': title,
+        'location': location,
+        'description': description,
+        'start': {
+            'dateTime': start_dt.isoformat(),
+            'timeZone': local_tz,
+        },
+        'end': {
+            'dateTime': end_dt.isoformat(),
+            'timeZone': local_tz,
+        },
+        'reminders': {
+            'useDefault': False,
+            'overrides': [
+                {'method': 'popup', 'minutes': reminder_minutes},
+            ],
+        },
+    }
+
+
 def create_calendar_event(
     title: str,
     start_time: str,
@@ -87,51 +358,19 @@ def create_calendar_event(
     Returns:
         Dictionary with event details including the link to the event
     """
-    logger.info(f"[TOOL] create_calendar_event: {title} at {start_time}")
+    logger.info("[TOOL] create_calendar_event: %s at %s", title, start_time)
     
     try:
         service = _get_service('calendar', 'v3')
         
-        # Parse start time
-        if 'T' in start_time:
-            start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-        else:
-            # Try to parse various formats
-            start_dt = datetime.fromisoformat(start_time)
-        
-        end_dt = start_dt + timedelta(hours=duration_hours)
-        
-        # Get local timezone - use Asia/Kolkata for IST
-        local_tz = 'Asia/Kolkata'
-        
-        # Build event body
-        event = {
-            'summary': title,
-            'location': location,
-            'description': description,
-            'start': {
-                'dateTime': start_dt.isoformat(),
-                'timeZone': local_tz,
-            },
-            'end': {
-                'dateTime': end_dt.isoformat(),
-                'timeZone': local_tz,
-            },
-            'reminders': {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'popup', 'minutes': reminder_minutes},
-                ],
-            },
-        }
-        
         # Create the event
         created_event = service.events().insert(
             calendarId=calendar_id,
-            body=event
+            body=_event_body(title, start_time, duration_hours, description, location, reminder_minutes)
         ).execute()
         
-        logger.info(f"[TOOL] Calendar event created: {created_event.get('id')}")
+        logger.info("[TOOL] Calendar event created: %s", created_event.get('id'))
+        _list_cache_invalidate('calendar')
         
         return {
             "success": True,
@@ -147,7 +386,97 @@ def create_calendar_event(
     except FileNotFoundError as e:
         return {"success": False, "error": str(e), "hint": "Run setup_google_auth.py first"}
     except Exception as e:
-        logger.error(f"[TOOL] Calendar error: {e}")
+        logger.error("[TOOL] Calendar error: %s", e)
+        return {"success": False, "error": str(e)}
+
+
+# Fields create_calendar_events_bulk reads from each event
+_BULK_EVENT_FIELDS = {
+    'title': (str, ''),
+    'start_time': (str, _REQUIRED),
+    'duration_hours': ((int, float), 1.0),
+    'description': (str, ''),
+    'location': (str, ''),
+    'reminder_minutes': (int, 30),
+}
+
+def create_calendar_events_bulk(
+    events: List[Dict[str, Any]],
+    calendar_id: str = "primary"
+) -> dict:
+    """
+    Create several Google Calendar events with one batched API request.
+    
+    Args:
+        events: List of events, each with "title" and "start_time" (ISO format,
+            e.g., "2025-12-15T10:00:00") and optional "duration_hours",
+            "description", "location" and "reminder_minutes"; a null optional
+            field gets its default
+        calendar_id: Which calendar to use (default: primary)
+    
+    Returns:
+        Dictionary with one result per event, in the same order as events
+    """
+    logger.info("[TOOL] create_calendar_events_bulk: %s events", len(events))
+    
+    try:
+        service = _get_service('calendar', 'v3')
+        
+        results: List[Optional[dict]] = [None] * len(events)
+        requests = []
+        positions = []
+        
+        for i, event in enumerate(events):
+            try:
+                fields = _bulk_item_fields(event, _BULK_EVENT_FIELDS)
+                body = _event_body(**fields)
+            except (ValueError, OverflowError) as e:
+                results[i] = {
+                    "success": False,
+                    "title": event.get('title') if isinstance(event, dict) else None,
+                    "error": f"Invalid event: {e}"
+                }
+                continue
+            requests.append(service.events().insert(calendarId=calendar_id, body=body))
+            positions.append(i)
+        
+        # One HTTP request per API_BATCH_SIZE inserts instead of one each
+        try:
+            outcomes = _execute_batch(service, requests)
+        finally:
+            _list_cache_invalidate('calendar')
+        
+        for i, (created_event, error) in zip(positions, outcomes):
+            if error is not None:
+                results[i] = {
+                    "success": False,
+                    "title": events[i].get('title'),
+                    "error": str(error)
+                }
+            else:
+                results[i] = {
+                    "success": True,
+                    "event_id": created_event.get('id'),
+                    "title": created_event.get('summary'),
+                    "start": created_event.get('start', {}).get('dateTime'),
+                    "end": created_event.get('end', {}).get('dateTime'),
+                    "html_link": created_event.get('htmlLink')
+                }
+        
+        created = sum(1 for r in results if r["success"])
+        logger.info("[TOOL] Calendar events created: %s/%s", created, len(events))
+        
+        return {
+            "success": created == len(events),
+            "count": created,
+            "events": results,
+            "message": f"✅ Created {created}/{len(events)} calendar events!"
+        }
+        
+    except FileNotFoundError as e:
+        return {"success": False, "error": str(e), "hint": "Run setup_google_auth.py first"}
+    except Exception as e:
+        logger.error("[TOOL] Bulk calendar error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -167,7 +496,13 @@ def list_calendar_events(
     Returns:
         Dictionary with list of events
     """
-    logger.info(f"[TOOL] list_calendar_events: max={max_results}")
+    logger.info("[TOOL] list_calendar_events: max=%s", max_results)
+    
+    cache_key = ('calendar', calendar_id, max_results, time_min)
+    cached = _list_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    generation = _list_cache_generation(cache_key[0])
     
     try:
         service = _get_service('calendar', 'v3')
@@ -196,17 +531,19 @@ def list_calendar_events(
                 "link": event.get('htmlLink', '')
             })
         
-        return {
+        result = {
             "success": True,
             "count": len(event_list),
             "events": event_list,
             "message": f"📅 Found {len(event_list)} upcoming events"
         }
+        _list_cache_set(cache_key, result, generation)
+        return result
         
     except FileNotFoundError as e:
         return {"success": False, "error": str(e)}
     except Exception as e:
-        logger.error(f"[TOOL] Calendar list error: {e}")
+        logger.error("[TOOL] Calendar list error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -214,6 +551,30 @@ def list_calendar_events(
 # GMAIL API
 # =============================================================================
 
+# Loose recipient check so an obviously bad address fails before any logging
+# or API work. Address lists are parsed with email.utils.getaddresses, so
+# quoted names ("Doe, John" <j@x.com>) and stray commas are fine; each
+# parsed address must look like user@domain.tld.
+_ADDRESS_RE = re.compile(r"[^@\s<>,]+@[^@\s<>,]+\.[^@\s<>,]+")
+
+def _invalid_recipient(to: str, cc: str = None, bcc: str = None) -> Optional[dict]:
+    """Return an error result if any to/cc/bcc address is not an email address"""
+    for field, value, required in (("recipient", to, True), ("cc", cc, False), ("bcc", bcc, False)):
+        if not value and not required:
+            continue
+        if not isinstance(value, str):
+            return {"success": False, "error": f"Invalid {field} email address: {value!r}"}
+        
+        addresses = [addr for name, addr in getaddresses([value]) if name or addr]
+        if not addresses:
+            return {"success": False, "error": f"Invalid {field} email address: {value!r}"}
+        for addr in addresses:
+            if not _ADDRESS_RE.fullmatch(addr):
+                return {"success": False, "error": f"Invalid {field} email address: {addr!r}"}
+    
+    return None
+
+
 def create_gmail_draft(
     to: str,
     subject: str,
@@ -234,7 +595,11 @@ def create_gmail_draft(
     Returns:
         Dictionary with draft details
     """
-    logger.info(f"[TOOL] create_gmail_draft: to={to}, subject={subject}")
+    invalid = _invalid_recipient(to, cc, bcc)
+    if invalid:
+        return invalid
+    
+    logger.info("[TOOL] create_gmail_draft: to=%s, subject=%s", to, subject)
     
     try:
         service = _get_service('gmail', 'v1')
@@ -257,7 +622,7 @@ def create_gmail_draft(
             body={'message': {'raw': raw}}
         ).execute()
         
-        logger.info(f"[TOOL] Gmail draft created: {draft.get('id')}")
+        logger.info("[TOOL] Gmail draft created: %s", draft.get('id'))
         
         return {
             "success": True,
@@ -272,7 +637,7 @@ def create_gmail_draft(
     except FileNotFoundError as e:
         return {"success": False, "error": str(e)}
     except Exception as e:
-        logger.error(f"[TOOL] Gmail error: {e}")
+        logger.error("[TOOL] Gmail error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -294,7 +659,11 @@ def send_email(
     Returns:
         Dictionary with send status
     """
-    logger.info(f"[TOOL] send_email: to={to}, subject={subject}")
+    invalid = _invalid_recipient(to, cc)
+    if invalid:
+        return invalid
+    
+    logger.info("[TOOL] send_email: to=%s, subject=%s", to, subject)
     
     try:
         service = _get_service('gmail', 'v1')
@@ -323,7 +692,7 @@ def send_email(
     except FileNotFoundError as e:
         return {"success": False, "error": str(e)}
     except Exception as e:
-        logger.error(f"[TOOL] Gmail send error: {e}")
+        logger.error("[TOOL] Gmail send error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -359,7 +728,7 @@ def list_task_lists() -> dict:
     except FileNotFoundError as e:
         return {"success": False, "error": str(e)}
     except Exception as e:
-        logger.error(f"[TOOL] Tasks list error: {e}")
+        logger.error("[TOOL] Tasks list error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -374,7 +743,13 @@ def list_tasks(task_list_id: str = "@default", show_completed: bool = False) ->
     Returns:
         Dictionary with tasks
     """
-    logger.info(f"[TOOL] list_tasks: list={task_list_id}")
+    logger.info("[TOOL] list_tasks: list=%s", task_list_id)
+    
+    cache_key = ('tasks', task_list_id, show_completed)
+    cached = _list_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    generation = _list_cache_generation(cache_key[0])
     
     try:
         service = _get_service('tasks', 'v1')
@@ -397,20 +772,38 @@ def list_tasks(task_list_id: str = "@default", show_completed: bool = False) ->
                 "notes": task.get('notes', '')
             })
         
-        return {
+        result = {
             "success": True,
             "count": len(task_list),
             "tasks": task_list,
             "message": f"✅ Found {len(task_list)} tasks"
         }
+        _list_cache_set(cache_key, result, generation)
+        return result
         
     except FileNotFoundError as e:
         return {"success": False, "error": str(e)}
     except Exception as e:
-        logger.error(f"[TOOL] Tasks error: {e}")
+        logger.error("[TOOL] Tasks error: %s", e)
         return {"success": False, "error": str(e)}
 
 
+def _task_body(title: str, notes: str = "", due_date: str = None) -> dict:
+    """Build a Google Tasks insert body"""
+    task_body = {
+        'title': title,
+        'notes': notes,
+    }
+    
+    if due_date:
+        # Google Tasks wants RFC 3339 format
+        if 'T' not in due_date:
+            due_date = due_date + 'T00:00:00.000Z'
+        task_body['due'] = due_date
+    
+    return task_body
+
+
 def create_task(
     title: str,
     notes: str = "",
@@ -429,28 +822,18 @@ def create_task(
     Returns:
         Dictionary with created task details
     """
-    logger.info(f"[TOOL] create_task: {title}")
+    logger.info("[TOOL] create_task: %s", title)
     
     try:
         service = _get_service('tasks', 'v1')
         
-        task_body = {
-            'title': title,
-            'notes': notes,
-        }
-        
-        if due_date:
-            # Google Tasks wants RFC 3339 format
-            if 'T' not in due_date:
-                due_date = due_date + 'T00:00:00.000Z'
-            task_body['due'] = due_date
-        
         task = service.tasks().insert(
             tasklist=task_list_id,
-            body=task_body
+            body=_task_body(title, notes, due_date)
         ).execute()
         
-        logger.info(f"[TOOL] Task created: {task.get('id')}")
+        logger.info("[TOOL] Task created: %s", task.get('id'))
+        _list_cache_invalidate('tasks')
         
         return {
             "success": True,
@@ -464,7 +847,92 @@ def create_task(
     except FileNotFoundError as e:
         return {"success": False, "error": str(e)}
     except Exception as e:
-        logger.error(f"[TOOL] Create task error: {e}")
+        logger.error("[TOOL] Create task error: %s", e)
+        return {"success": False, "error": str(e)}
+
+
+# Fields create_tasks_bulk reads from each task
+_BULK_TASK_FIELDS = {
+    'title': (str, ''),
+    'notes': (str, ''),
+    'due_date': (str, None),
+    'task_list_id': (str, '@default'),
+}
+
+def create_tasks_bulk(tasks: List[Dict[str, Any]]) -> dict:
+    """
+    Create several tasks in Google Tasks with one batched API request.
+    
+    Args:
+        tasks: List of tasks, each with a "title" and optional "notes",
+            "due_date" (e.g., "2025-12-15") and "task_list_id" (default "@default");
+            a null optional field gets its default
+    
+    Returns:
+        Dictionary with one result per task, in the same order as tasks
+    """
+    logger.info("[TOOL] create_tasks_bulk: %s tasks", len(tasks))
+    
+    try:
+        service = _get_service('tasks', 'v1')
+        
+        results: List[Optional[dict]] = [None] * len(tasks)
+        requests = []
+        positions = []
+        
+        for i, task in enumerate(tasks):
+            try:
+                fields = _bulk_item_fields(task, _BULK_TASK_FIELDS)
+            except ValueError as e:
+                results[i] = {
+                    "success": False,
+                    "title": task.get('title') if isinstance(task, dict) else None,
+                    "error": f"Invalid task: {e}"
+                }
+                continue
+            
+            requests.append(service.tasks().insert(
+                tasklist=fields['task_list_id'],
+                body=_task_body(fields['title'], fields['notes'], fields['due_date'])
+            ))
+            positions.append(i)
+        
+        # One HTTP request per API_BATCH_SIZE inserts instead of one each
+        try:
+            outcomes = _execute_batch(service, requests)
+        finally:
+            _list_cache_invalidate('tasks')
+        
+        for i, (response, error) in zip(positions, outcomes):
+            if error is not None:
+                results[i] = {
+                    "success": False,
+                    "title": tasks[i].get('title'),
+                    "error": str(error)
+                }
+            else:
+                results[i] = {
+                    "success": True,
+                    "task_id": response.get('id'),
+                    "title": response.get('title'),
+                    "status": response.get('status'),
+                    "due": response.get('due', 'No due date')
+                }
+        
+        created = sum(1 for r in results if r["success"])
+        logger.info("[TOOL] Tasks created: %s/%s", created, len(tasks))
+        
+        return {
+            "success": created == len(tasks),
+            "count": created,
+            "tasks": results,
+            "message": f"✅ Created {created}/{len(tasks)} tasks!"
+        }
+        
+    except FileNotFoundError as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        logger.error("[TOOL] Bulk create tasks error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -479,7 +947,7 @@ def complete_task(task_id: str, task_list_id: str = "@default") -> dict:
     Returns:
         Dictionary with completion status
     """
-    logger.info(f"[TOOL] complete_task: {task_id}")
+    logger.info("[TOOL] complete_task: %s", task_id)
     
     try:
         service = _get_service('tasks', 'v1')
@@ -499,6 +967,8 @@ def complete_task(task_id: str, task_list_id: str = "@default") -> dict:
             body=task
         ).execute()
         
+        _list_cache_invalidate('tasks')
+        
         return {
             "success": True,
             "task_id": updated.get('id'),
@@ -510,7 +980,7 @@ def complete_task(task_id: str, task_list_id: str = "@default") -> dict:
     except FileNotFoundError as e:
         return {"success": False, "error": str(e)}
     except Exception as e:
-        logger.error(f"[TOOL] Complete task error: {e}")
+        logger.error("[TOOL] Complete task error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -531,7 +1001,7 @@ def search_google_photos(query: str, max_results: int = 10) -> dict:
     Returns:
         Dictionary with found photos or helpful message if API unavailable
     """
-    logger.info(f"[TOOL] search_google_photos: query='{query}'")
+    logger.info("[TOOL] search_google_photos: query='%s'", query)
     
     try:
         service = _get_service('photoslibrary', 'v1')
@@ -590,7 +1060,7 @@ def search_google_photos(query: str, max_results: int = 10) -> dict:
                 ],
                 "help": "To enable Photos: Your Google Cloud project needs verification, or you can try adding the photoslibrary scope to your OAuth consent screen's test scopes."
             }
-        logger.error(f"[TOOL] Photos search error: {e}")
+        logger.error("[TOOL] Photos search error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -603,6 +1073,12 @@ def list_photo_albums() -> dict:
     """
     logger.info("[TOOL] list_photo_albums")
     
+    cache_key = ('photoslibrary',)
+    cached = _list_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    generation = _list_cache_generation(cache_key[0])
+    
     try:
         service = _get_service('photoslibrary', 'v1')
         
@@ -618,12 +1094,14 @@ def list_photo_albums() -> dict:
                 "productUrl": album.get('productUrl', '')
             })
         
-        return {
+        result = {
             "success": True,
             "count": len(album_list),
             "albums": album_list,
             "message": f"📁 Found {len(album_list)} albums"
         }
+        _list_cache_set(cache_key, result, generation)
+        return result
         
     except FileNotFoundError as e:
         return {"success": False, "error": str(e)}
@@ -635,7 +1113,7 @@ def list_photo_albums() -> dict:
                 "message": "📸 Google Photos access requires additional setup. Visit https://photos.google.com directly.",
                 "alternatives": ["Access photos at https://photos.google.com"]
             }
-        logger.error(f"[TOOL] Albums error: {e}")
+        logger.error("[TOOL] Albums error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -650,7 +1128,7 @@ def get_photos_from_album(album_id: str, max_results: int = 25) -> dict:
     Returns:
         Dictionary with photos in the album
     """
-    logger.info(f"[TOOL] get_photos_from_album: {album_id}")
+    logger.info("[TOOL] get_photos_from_album: %s", album_id)
     
     try:
         service = _get_service('photoslibrary', 'v1')
@@ -687,7 +1165,7 @@ def get_photos_from_album(album_id: str, max_results: int = 25) -> dict:
     except FileNotFoundError as e:
         return {"success": False, "error": str(e)}
     except Exception as e:
-        logger.error(f"[TOOL] Album photos error: {e}")
+        logger.error("[TOOL] Album photos error: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -695,6 +1173,11 @@ def get_photos_from_album(album_id: str, max_results: int = 25) -> dict:
 # UTILITY: Get current datetime
 # =============================================================================
 
+# Every agent is told to call get_current_datetime first, so one turn often
+# asks for it several times within milliseconds; reuse the answer briefly.
+DATETIME_CACHE_TTL_SECONDS = 1.0
+_datetime_cache: Optional[tuple] = None
+
 def get_current_datetime() -> dict:
     """
     Get the current date and time.
@@ -702,12 +1185,21 @@ def get_current_datetime() -> dict:
     Returns:
         Dictionary with current datetime information
     """
+    global _datetime_cache
+    
+    cached = _datetime_cache
+    if cached is not None and time.monotonic() - cached[0] < DATETIME_CACHE_TTL_SECONDS:
+        return dict(cached[1])
+    
     now = datetime.now()
     
-    return {
+    result = {
         "datetime": now.isoformat(),
         "date": now.strftime("%A, %B %d, %Y"),
         "time": now.strftime("%I:%M %p"),
         "timezone": "Local",
         "is_weekend": now.weekday() >= 5
     }
+    # Keep a copy so a caller modifying the result cannot change later answers
+    _datetime_cache = (time.monotonic(), dict(result))
+    return result
@@ -19,8 +19,6 @@ SETUP INSTRUCTIONS:
 """
 
 import os
-import json
-from pathlib import Path
 
 # Check if google packages are installed
 try:
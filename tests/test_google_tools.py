@@ -0,0 +1,175 @@
+"""
+Tests for the Google API helpers in life_admin_agent.google_tools
+
+The helpers are exercised with fake service objects, so no credentials or
+network access are needed.
+"""
+
+import pytest
+
+from life_admin_agent import google_tools
+from life_admin_agent.google_tools import (
+    API_BATCH_SIZE,
+    LIST_CACHE_MAX_ENTRIES,
+    _execute_batch,
+    _list_cache_generation,
+    _list_cache_get,
+    _list_cache_invalidate,
+    _list_cache_set,
+)
+
+
+# =============================================================================
+# FAKE BATCH SERVICE
+# =============================================================================
+
+class FakeBatch:
+    """Stands in for googleapiclient's BatchHttpRequest"""
+    
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+    
+    def add(self, request, request_id):
+        self.requests.append((request, request_id))
+    
+    def execute(self):
+        self.service.executed.append([request for request, _ in self.requests])
+        if len(self.service.executed) in self.service.fail_on_execute:
+            raise RuntimeError("batch failed")
+        for request, request_id in self.requests:
+            if request in self.service.failing_requests:
+                self.callback(request_id, None, ValueError(f"bad {request}"))
+            else:
+                self.callback(request_id, {"id": request}, None)
+
+
+class FakeService:
+    """Records every batch call made through new_batch_http_request"""
+    
+    def __init__(self, failing_requests=(), fail_on_execute=()):
+        self.failing_requests = set(failing_requests)
+        self.fail_on_execute = set(fail_on_execute)
+        self.executed = []
+    
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+
+# =============================================================================
+# _execute_batch
+# =============================================================================
+
+def test_execute_batch_splits_into_chunks_and_keeps_order():
+    service = FakeService()
+    requests = [f"req-{i}" for i in range(API_BATCH_SIZE * 2 + 5)]
+    
+    outcomes = _execute_batch(service, requests)
+    
+    assert [len(chunk) for chunk in service.executed] == [API_BATCH_SIZE, API_BATCH_SIZE, 5]
+    assert outcomes == [({"id": request}, None) for request in requests]
+
+
+def test_execute_batch_reports_per_item_errors():
+    service = FakeService(failing_requests={"req-1"})
+    
+    outcomes = _execute_batch(service, ["req-0", "req-1", "req-2"])
+    
+    assert outcomes[0] == ({"id": "req-0"}, None)
+    assert outcomes[1][0] is None
+    assert isinstance(outcomes[1][1], ValueError)
+    assert outcomes[2] == ({"id": "req-2"}, None)
+
+
+def test_execute_batch_keeps_earlier_chunks_when_a_later_one_fails():
+    service = FakeService(fail_on_execute={2})
+    requests = [f"req-{i}" for i in range(API_BATCH_SIZE * 3)]
+    
+    outcomes = _execute_batch(service, requests)
+    
+    # The third chunk is never sent once the second one fails
+    assert len(service.executed) == 2
+    first_chunk, rest = outcomes[:API_BATCH_SIZE], outcomes[API_BATCH_SIZE:]
+    assert first_chunk == [({"id": request}, None) for request in requests[:API_BATCH_SIZE]]
+    assert all(response is None and isinstance(error, RuntimeError) for response, error in rest)
+
+
+def test_execute_batch_with_no_requests_sends_nothing():
+    service = FakeService()
+    
+    assert _execute_batch(service, []) == []
+    assert service.executed == []
+
+
+# =============================================================================
+# LIST CACHE
+# =============================================================================
+
+@pytest.fixture
+def list_cache(monkeypatch):
+    """Give each test an empty list cache with caching enabled"""
+    cache = {}
+    monkeypatch.setattr(google_tools, "_list_cache", cache)
+    monkeypatch.setattr(google_tools, "_list_cache_generations", {})
+    monkeypatch.setattr(google_tools, "LIST_CACHE_TTL_SECONDS", 30.0)
+    return cache
+
+
+def test_list_cache_returns_stored_result(list_cache):
+    key = ("tasks", "@default", False)
+    
+    _list_cache_set(key, {"tasks": ["a"]}, _list_cache_generation("tasks"))
+    
+    assert _list_cache_get(key) == {"tasks": ["a"]}
+
+
+def test_list_cache_drops_fill_started_before_an_invalidation(list_cache):
+    key = ("tasks", "@default", False)
+    generation = _list_cache_generation("tasks")
+    
+    # A write lands while the listing is still in flight
+    _list_cache_invalidate("tasks")
+    _list_cache_set(key, {"tasks": ["stale"]}, generation)
+    
+    assert _list_cache_get(key) is None
+
+
+def test_list_cache_invalidation_only_affects_its_api(list_cache):
+    calendar_key = ("calendar", "primary", 10, None)
+    calendar_generation = _list_cache_generation("calendar")
+    
+    _list_cache_invalidate("tasks")
+    _list_cache_set(calendar_key, {"events": []}, calendar_generation)
+    
+    assert _list_cache_get(calendar_key) == {"events": []}
+
+
+def test_list_cache_invalidate_removes_cached_results(list_cache):
+    key = ("tasks", "@default", False)
+    _list_cache_set(key, {"tasks": ["a"]}, _list_cache_generation("tasks"))
+    
+    _list_cache_invalidate("tasks")
+    
+    assert _list_cache_get(key) is None
+
+
+def test_list_cache_is_bounded_and_evicts_oldest(list_cache):
+    for i in range(LIST_CACHE_MAX_ENTRIES * 3):
+        _list_cache_set(("calendar", i), {"i": i}, _list_cache_generation("calendar"))
+    
+    assert len(list_cache) == LIST_CACHE_MAX_ENTRIES
+    assert _list_cache_get(("calendar", 0)) is None
+    last = LIST_CACHE_MAX_ENTRIES * 3 - 1
+    assert _list_cache_get(("calendar", last)) == {"i": last}
+
+
+def test_list_cache_results_are_copies(list_cache):
+    key = ("tasks", "@default", False)
+    result = {"tasks": [{"title": "a"}]}
+    _list_cache_set(key, result, _list_cache_generation("tasks"))
+    
+    result["tasks"].append({"title": "added by caller"})
+    _list_cache_get(key)["tasks"][0]["title"] = "changed by caller"
+    
+    assert _list_cache_get(key) == {"tasks": [{"title": "a"}]}